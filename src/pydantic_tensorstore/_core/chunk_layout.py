@@ -9,6 +9,14 @@ from annotated_types import Ge, Interval
 from pydantic import BaseModel, Field, NonNegativeFloat, NonNegativeInt, model_validator
 from typing_extensions import Self
 
+# fields of ChunkLayoutGrid that must all have the same length (rank), if given
+_GRID_ARRAY_FIELDS = (
+    "shape",
+    "shape_soft_constraint",
+    "aspect_ratio",
+    "aspect_ratio_soft_constraint",
+)
+
 
 class ChunkLayoutGrid(BaseModel):
     """Constraints on the write/read/codec chunk grids."""
@@ -75,13 +83,7 @@ resultant chunk size will be [60, 90, 90] (assuming it is not otherwise constrai
         """Validate that all array fields have consistent lengths."""
         arrays: list[int] = []
         array_names: list[str] = []
-        field_names = [
-            "shape",
-            "shape_soft_constraint",
-            "aspect_ratio",
-            "aspect_ratio_soft_constraint",
-        ]
-        for field_name in field_names:
+        for field_name in _GRID_ARRAY_FIELDS:
             value = getattr(self, field_name)
             if isinstance(value, list):
                 arrays.append(len(value))
@@ -78,7 +78,7 @@ class BaseSpec(BaseModel):
             data = super().model_dump(*args, **kwargs)
             return data
 
-        def model_dump_json(self, *args: Any, **kwargs: Any) -> dict:
+        def model_dump_json(self, *args: Any, **kwargs: Any) -> str:
             """Workaround for pydantic v2 bug with ClassVar and mypy."""
             kwargs.setdefault("by_alias", True)
             kwargs.setdefault("exclude_none", True)
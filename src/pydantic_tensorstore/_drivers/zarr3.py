@@ -338,16 +338,19 @@ class Zarr3Metadata(BaseModel):
         classmethod(_validate_labels)
     )
 
+    @property
+    def chunk_shape(self) -> list[int] | None:
+        """Chunk shape from the regular chunk grid, if specified."""
+        if self.chunk_grid is None:
+            return None
+        return self.chunk_grid.configuration.chunk_shape
+
     @model_validator(mode="after")
     def _validate_chunk_shape_length(self) -> Self:
         """Validate that chunk_shape length matches array shape length."""
-        if (
-            self.shape is not None
-            and self.chunk_grid is not None
-            and self.chunk_grid.configuration.chunk_shape is not None
-        ):
+        if self.shape is not None and (chunk_shape := self.chunk_shape) is not None:
             shape_len = len(self.shape)
-            chunk_shape_len = len(self.chunk_grid.configuration.chunk_shape)
+            chunk_shape_len = len(chunk_shape)
             if shape_len != chunk_shape_len:
                 raise ValueError(
                     f"chunk_shape length ({chunk_shape_len}) must match "
@@ -1,5 +1,6 @@
 """Key-value store specifications for TensorStore."""
 
+from collections.abc import Callable
 from typing import Annotated, Any, TypeAlias
 
 from pydantic import BeforeValidator, Field
@@ -18,25 +19,41 @@ __all__ = [
 ]
 
 
+def _file_url_to_kv_store(path: str) -> dict[str, Any]:
+    return {"driver": "file", "path": path}
+
+
+def _memory_url_to_kv_store(path: str) -> dict[str, Any]:
+    store: dict[str, Any] = {"driver": "memory"}
+    if path:
+        store["path"] = path
+    return store
+
+
+def _s3_url_to_kv_store(bucket: str) -> dict[str, Any]:
+    store: dict[str, Any] = {"driver": "s3"}
+    bucket_name, *path = bucket.split("/", 1)
+    store["bucket"] = bucket_name
+    if path:
+        store["path"] = path[0]
+    return store
+
+
+# map of URL scheme -> function converting the remainder of the URL to a kvstore dict
+_URL_SCHEMES: dict[str, Callable[[str], dict[str, Any]]] = {
+    "file": _file_url_to_kv_store,
+    "memory": _memory_url_to_kv_store,
+    "s3": _s3_url_to_kv_store,
+}
+
+
 def _str_to_kv_store(value: Any) -> Any:
     """Convert a string to a kvstore specification dictionary."""
     if not isinstance(value, str):
         return value
-    if value.startswith("file://"):
-        return {"driver": "file", "path": value[len("file://") :]}
-    if value.startswith("memory://"):
-        store = {"driver": "memory"}
-        if value != "memory://":
-            store["path"] = value[len("memory://") :]
-        return store
-    if value.startswith("s3://"):
-        store = {"driver": "s3"}
-        bucket = value[len("s3://") :]
-        bucket_name, *path = bucket.split("/", 1)
-        store["bucket"] = bucket_name
-        if path:
-            store["path"] = path[0]
-        return store
+    scheme, sep, rest = value.partition("://")
+    if sep and (converter := _URL_SCHEMES.get(scheme)) is not None:
+        return converter(rest)
     raise ValueError(f"Invalid kvstore string: {value}")
 
 
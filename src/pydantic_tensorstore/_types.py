@@ -99,11 +99,15 @@ class DataType(str, Enum):
                 )
             return v
 
+        def _dtype_to_str(v: Any) -> str:
+            # read the value directly, rather than dispatching through __str__
+            return v.value if isinstance(v, DataType) else str(v)
+
         return core_schema.no_info_before_validator_function(
             function=_cast_to_dtype,
             schema=schema,
             serialization=core_schema.plain_serializer_function_ser_schema(
-                function=str,
+                function=_dtype_to_str,
                 return_schema=core_schema.str_schema(),
             ),
         )
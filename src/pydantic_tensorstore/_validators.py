@@ -1,6 +1,7 @@
 """High-level validation functions for TensorStore specifications."""
 
-from typing import TYPE_CHECKING, Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast, get_args
 
 from pydantic import TypeAdapter
 
@@ -8,6 +9,24 @@ if TYPE_CHECKING:
     from pydantic_tensorstore import TensorStoreSpec
 
 
+@cache
+def _spec_adapter() -> "TypeAdapter[TensorStoreSpec]":
+    """Return the (lazily built, shared) TypeAdapter for TensorStoreSpec."""
+    # imported here, since the models are only complete once the package is loaded
+    from pydantic_tensorstore import TensorStoreSpec
+
+    return TypeAdapter[TensorStoreSpec](TensorStoreSpec)
+
+
+@cache
+def _spec_types() -> frozenset[type]:
+    """Return the concrete model classes in the TensorStoreSpec union."""
+    from pydantic_tensorstore import TensorStoreSpec
+
+    union, *_ = get_args(TensorStoreSpec)
+    return frozenset(get_args(union))
+
+
 def validate_spec(spec: Any, strict: bool = False) -> "TensorStoreSpec":
     """Validate a TensorStore specification.
 
@@ -23,10 +42,12 @@ def validate_spec(spec: Any, strict: bool = False) -> "TensorStoreSpec":
     TensorStoreSpec
         Validated specification object
     """
-    from pydantic_tensorstore import TensorStoreSpec
+    # already-validated models are returned unchanged by pydantic anyway
+    if type(spec) in _spec_types():
+        return cast("TensorStoreSpec", spec)
 
-    adapter = TypeAdapter[TensorStoreSpec](TensorStoreSpec)
-    if isinstance(spec, str | bytes | bytearray):
+    adapter = _spec_adapter()
+    # (a tuple is cheaper to check against than a `str | bytes | bytearray` union)
+    if isinstance(spec, (str, bytes, bytearray)):
         return adapter.validate_json(spec, strict=strict)
-    else:
-        return adapter.validate_python(spec, strict=strict)
+    return adapter.validate_python(spec, strict=strict)
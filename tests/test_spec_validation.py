@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 from pydantic import ValidationError
 
+import pydantic_tensorstore as pts
 from pydantic_tensorstore import validate_spec
 
 
@@ -159,3 +160,20 @@ def test_validation_modes() -> None:
     # Non-strict mode
     validated_non_strict = validate_spec(spec_dict, strict=False)
     assert validated_non_strict.driver == "array"
+
+
+def test_zarr3_chunk_shape() -> None:
+    """Test the Zarr3Metadata.chunk_shape shortcut to the chunk grid."""
+    spec_dict = {
+        "driver": "zarr3",
+        "kvstore": {"driver": "memory"},
+        "metadata": {
+            "shape": [100, 200],
+            "chunk_grid": {"configuration": {"chunk_shape": [10, 20]}},
+        },
+    }
+
+    spec = validate_spec(spec_dict)
+    assert spec.metadata is not None
+    assert spec.metadata.chunk_shape == [10, 20]
+    assert pts.Zarr3Metadata(shape=[1, 2]).chunk_shape is None
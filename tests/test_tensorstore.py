@@ -1,15 +1,15 @@
+import json
+import os
+from copy import deepcopy
 from importlib.metadata import version
-from pathlib import Path
 
 import pytest
+from packaging.version import Version
 
 import pydantic_tensorstore as pts
 from pydantic_tensorstore import validate_spec
 
-try:
-    import tensorstore as ts
-except ImportError:
-    pytest.skip("tensorstore not installed", allow_module_level=True)
+ts = pytest.importorskip("tensorstore")
 
 
 # Test cases for round-trip validation
@@ -318,8 +318,8 @@ ROUND_TRIP_TEST_CASES = [
     },
 ]
 
-ts_version = tuple(int(x) for x in version("tensorstore").split(".")[:3])
-if ts_version >= (0, 1, 76):
+TS_VERSION = Version(version("tensorstore"))
+if TS_VERSION >= Version("0.1.76"):
     ROUND_TRIP_TEST_CASES += [
         # Auto driver examples (validation-only, no actual creation)
         {
@@ -350,12 +350,39 @@ if ts_version >= (0, 1, 76):
     ]
 
 
-@pytest.mark.parametrize("test_case", ROUND_TRIP_TEST_CASES, ids=lambda x: x["id"])
+def _first_in_memory_case_per_driver(cases: list[dict]) -> dict[str, dict]:
+    by_driver: dict[str, dict] = {}
+    for case in cases:
+        if case["spec"].get("kvstore", {}).get("driver") != "file":
+            by_driver.setdefault(case["spec"]["driver"], case)
+    return by_driver
+
+
+# One in-memory case per driver, for checking that ts.Spec objects are accepted
+TS_SPEC_TEST_CASES = _first_in_memory_case_per_driver(ROUND_TRIP_TEST_CASES)
+
+
+@pytest.fixture(scope="session")
+def ts_context() -> "ts.Context":
+    """A tensorstore Context shared by all stores opened in this session."""
+    return ts.Context(
+        {
+            "cache_pool": {"total_bytes_limit": 10_000_000},
+            # throwaway stores in tmp dirs don't need to be fsync'd
+            "file_io_sync": False,
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "test_case", ROUND_TRIP_TEST_CASES, ids=[c["id"] for c in ROUND_TRIP_TEST_CASES]
+)
 def test_round_trip_validation(
-    test_case: dict, tmp_path_factory: pytest.TempPathFactory
+    test_case: dict, tmp_path_factory: pytest.TempPathFactory, ts_context: "ts.Context"
 ) -> None:
     """Test round-trip validation: dict -> our_spec -> tensorstore -> our_spec."""
-    spec_dict: dict = test_case["spec"]
+    # copy, so the shared test case is not mutated below
+    spec_dict: dict = deepcopy(test_case["spec"])
 
     # Use a temporary path for file-based kvstores
     kvstore = spec_dict.get("kvstore", {})
@@ -369,23 +396,33 @@ def test_round_trip_validation(
     # First validate our spec
     our_spec = validate_spec(spec_dict)
 
-    # Validate that we can also validate the tensorstore spec object
-    validate_spec(ts_spec)
-
-    our_spec.model_dump(mode="json", exclude_none=True)
+    # the JSON serializer must agree with the dict dump that to_tensorstore() uses
+    assert json.loads(our_spec.model_dump_json()) == our_spec.model_dump(mode="json")
 
     ts_roundtrip = our_spec.to_tensorstore()
 
     # The round trip should work
-    assert ts_roundtrip == ts_spec
+    assert ts_roundtrip.to_json() == ts_spec.to_json()
 
     # create an actual tensorstore object to ensure the spec is valid
     if spec_dict.get("create") is not False and not test_case.get(
         "skip_creation", False
     ):
-        ts.open(ts_roundtrip, create=True).result()
+        # each case gets its own memory kvstore; other resources come from the parent
+        context = ts.Context({"memory_key_value_store": {}}, parent=ts_context)
+        ts.open(ts_roundtrip, create=True, context=context).result()
         if isinstance(store := getattr(our_spec, "kvstore", None), pts.FileKvStore):
-            assert Path(store.path).exists()
+            assert os.path.exists(store.path)
+
+
+@pytest.mark.parametrize(
+    "test_case", TS_SPEC_TEST_CASES.values(), ids=list(TS_SPEC_TEST_CASES)
+)
+def test_validate_ts_spec(test_case: dict) -> None:
+    """Test that a tensorstore.Spec object can be validated and round-tripped."""
+    ts_spec = ts.Spec(test_case["spec"])
+    our_spec = validate_spec(ts_spec)
+    assert our_spec.to_tensorstore().to_json() == ts_spec.to_json()
 
 
 def test_example() -> None: